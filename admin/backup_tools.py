@@ -11,7 +11,7 @@ import shutil
 from datetime import datetime
 from typing import Tuple
 from config import DB_PATH
-from database.operations import load_albums, load_concerts, get_database_stats
+from database.operations import load_albums, load_concerts, get_database_stats, clear_list_caches
 
 def admin_backup_page():
     """Admin database backup and restore page"""
@@ -253,6 +253,7 @@ def import_database_from_json(json_data: str) -> Tuple[bool, str]:
         
         conn.commit()
         conn.close()
+        clear_list_caches()
         return True, f"Successfully imported {len(data.get('albums', []))} albums and {len(data.get('concerts', []))} concerts"
     except Exception as e:
         return False, f"Error importing database: {e}"
@@ -296,6 +297,9 @@ def restore_database_from_file(uploaded_file) -> Tuple[bool, str]:
         
         conn.close()
         
+        # The file was replaced either way, so cached lists are stale
+        clear_list_caches()
+        
         if len(tables) == 2:
             return True, f"Database restored successfully. Backup saved as {backup_filename}"
         else:
@@ -4,6 +4,7 @@
 # ===========================
 
 import streamlit as st
+import logging
 import sys
 import os
 
@@ -12,7 +13,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import init_session_state, PAGE_CONFIG
 from database.init_db import init_db
-from ui.styling import get_custom_css
+from ui.styling import CUSTOM_CSS
+
+# Service errors are reported through logging; only warnings and above by default
+logging.basicConfig(level=logging.WARNING)
 
 def main():
     """Main entry point for the MetalWall app"""
@@ -20,7 +24,7 @@ def main():
     st.set_page_config(**PAGE_CONFIG)
     
     # Apply custom CSS
-    st.markdown(get_custom_css(), unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     # Initialize session state
     init_session_state()
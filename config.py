@@ -16,6 +16,12 @@ PAGE_CONFIG = {
 # Database configuration
 DB_PATH = "metal_music.db"
 
+# On-disk cache for Spotify album search results
+SPOTIFY_CACHE_DIR = "spotify_cache"
+SPOTIFY_CACHE_TTL = 24 * 60 * 60  # seconds
+RELATED_ARTISTS_CACHE_TTL = 60 * 60  # seconds
+METADATA_CACHE_TTL = 60 * 60  # seconds
+
 # API service names
 SPOTIFY = "spotify"
 LASTFM = "lastfm"
@@ -40,6 +46,7 @@ PLATFORMS = {
 # Default values
 DEFAULT_SORT_OPTION = "Timeline"
 SORT_OPTIONS = ["Timeline", "Votes"]
+RECORDS_PAGE_SIZE = 20  # albums shown per "Load more" step
 
 # Navigation options
 ADMIN_NAV_OPTIONS = ["💿 Records", "🎸 Gigs", "🎲 Random Album", "👤 Profile", "🔧 Admin Tools"]
@@ -60,10 +67,15 @@ def init_session_state():
         'form_submitted': False,
         'success_message': "",
         'sort_option': DEFAULT_SORT_OPTION,
+        'records_shown': RECORDS_PAGE_SIZE,
         'random_discovery_data': None,
         'show_discovery_history': False,
+        'album_form_error': None,
+        'pending_album_submission': None,
+        'discovery_error': None,
+        'next_discovery': None,
+        'discover_another_artist': None,
     }
     
     for key, value in default_state.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
\ No newline at end of file
+        st.session_state.setdefault(key, value)
\ No newline at end of file
@@ -62,6 +62,7 @@ def init_db():
     
     # Create indexes
     c.execute('''CREATE INDEX IF NOT EXISTS idx_albums_username ON albums(username)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_albums_url ON albums(url)''')
     c.execute('''CREATE INDEX IF NOT EXISTS idx_concerts_username ON concerts(username)''')
     c.execute('''CREATE INDEX IF NOT EXISTS idx_concerts_date ON concerts(date)''')
     c.execute('''CREATE INDEX IF NOT EXISTS idx_discoveries_username ON album_discoveries(username)''')
@@ -3,8 +3,9 @@
 # DATABASE MODELS AND SCHEMA
 # ===========================
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import cached_property
 from typing import List, Optional
 import json
 
@@ -22,6 +23,11 @@ class Album:
     likes: List[str]
     timestamp: datetime
     created_at: datetime
+    # Lowercased tags for the feed filter; set once here so the cached album list carries it
+    tags_lower: frozenset = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.tags_lower = frozenset(tag.lower() for tag in self.tags or ())
     
     @classmethod
     def from_db_row(cls, row):
@@ -87,6 +93,11 @@ class Concert:
             timestamp=datetime.fromisoformat(row[9]),
             created_at=datetime.fromisoformat(row[10]) if row[10] else datetime.fromisoformat(row[9])
         )
+    
+    @cached_property
+    def date_parsed(self) -> date:
+        """Concert date (stored as YYYY-MM-DD), parsed once per instance"""
+        return date.fromisoformat(self.date)
 
 @dataclass
 class AlbumDiscovery:
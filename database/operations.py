@@ -3,12 +3,21 @@
 # DATABASE CRUD OPERATIONS
 # ===========================
 
+import queue
 import sqlite3
+import threading
+import streamlit as st
 from datetime import datetime
 from typing import List, Optional
 from .models import Album, Concert, AlbumDiscovery
 from config import DB_PATH
 
+# Seconds a loaded album/concert list is reused across reruns; every write clears it
+LIST_CACHE_TTL = 60
+
+# Day of the last past-concert purge; the cutoff is a date, so once a day is enough
+_last_concert_purge_day: Optional[str] = None
+
 # ============ ALBUM OPERATIONS ============
 
 def save_album(username: str, url: str, artist: str, album_name: str, 
@@ -23,24 +32,49 @@ def save_album(username: str, url: str, artist: str, album_name: str,
         ''', (username, url, artist, album_name, cover_url, platform, str(tags), str([])))
         conn.commit()
         conn.close()
+        _query_albums.clear()
         return True
     except Exception as e:
         print(f"Error saving album: {e}")
         return False
 
+# The cached _query_* readers raise on errors rather than returning [], so
+# a failed read is never cached; load_albums/load_concerts turn it into []
 def load_albums() -> List[Album]:
     """Load all albums from database"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        return _query_albums()
+    except Exception as e:
+        print(f"Error loading albums: {e}")
+        return []
+
+@st.cache_data(ttl=LIST_CACHE_TTL, show_spinner=False)
+def _query_albums() -> List[Album]:
+    """Read all albums, newest first"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
         c = conn.cursor()
         c.execute('SELECT * FROM albums ORDER BY timestamp DESC')
         rows = c.fetchall()
+    finally:
+        conn.close()
+    
+    return [Album.from_db_row(row) for row in rows]
+
+def load_random_album() -> Optional[Album]:
+    """Load a single random album without reading the whole table"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        c = conn.cursor()
+        # Pick the id first so only the chosen row is read in full
+        c.execute('SELECT * FROM albums WHERE id = (SELECT id FROM albums ORDER BY RANDOM() LIMIT 1)')
+        row = c.fetchone()
         conn.close()
         
-        return [Album.from_db_row(row) for row in rows]
+        return Album.from_db_row(row) if row else None
     except Exception as e:
-        print(f"Error loading albums: {e}")
-        return []
+        print(f"Error loading random album: {e}")
+        return None
 
 def update_album(album_id: int, url: str, artist: str, album_name: str, 
                  cover_url: str, platform: str, tags: List[str]) -> bool:
@@ -55,6 +89,7 @@ def update_album(album_id: int, url: str, artist: str, album_name: str,
         ''', (url, artist, album_name, cover_url, platform, str(tags), album_id))
         conn.commit()
         conn.close()
+        _query_albums.clear()
         return True
     except Exception as e:
         print(f"Error updating album: {e}")
@@ -68,6 +103,7 @@ def update_album_likes(album_id: int, likes_list: List[str]) -> bool:
         c.execute('UPDATE albums SET likes = ? WHERE id = ?', (str(likes_list), album_id))
         conn.commit()
         conn.close()
+        _query_albums.clear()
         return True
     except Exception as e:
         print(f"Error updating album likes: {e}")
@@ -81,6 +117,7 @@ def delete_album(album_id: int) -> bool:
         c.execute('DELETE FROM albums WHERE id = ?', (album_id,))
         conn.commit()
         conn.close()
+        _query_albums.clear()
         return True
     except Exception as e:
         print(f"Error deleting album: {e}")
@@ -113,6 +150,7 @@ def save_concert(username: str, bands: str, date: str, venue: str,
         ''', (username, bands, date, venue, city, str(tags), info, str([])))
         conn.commit()
         conn.close()
+        _query_concerts.clear()
         return True
     except Exception as e:
         print(f"Error saving concert: {e}")
@@ -121,16 +159,28 @@ def save_concert(username: str, bands: str, date: str, venue: str,
 def load_concerts() -> List[Concert]:
     """Load all concerts"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        return _query_concerts()
+    except Exception as e:
+        print(f"Error loading concerts: {e}")
+        return []
+
+@st.cache_data(ttl=LIST_CACHE_TTL, show_spinner=False)
+def _query_concerts() -> List[Concert]:
+    """Read all concerts, soonest first"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
         c = conn.cursor()
         c.execute('SELECT * FROM concerts ORDER BY date ASC')
         rows = c.fetchall()
+    finally:
         conn.close()
-        
-        return [Concert.from_db_row(row) for row in rows]
-    except Exception as e:
-        print(f"Error loading concerts: {e}")
-        return []
+    
+    return [Concert.from_db_row(row) for row in rows]
+
+def clear_list_caches():
+    """Drop the cached album and concert lists (after bulk changes like a restore)"""
+    _query_albums.clear()
+    _query_concerts.clear()
 
 def update_concert(concert_id: int, bands: str, date: str, venue: str, 
                    city: str, tags: List[str], info: str) -> bool:
@@ -145,6 +195,7 @@ def update_concert(concert_id: int, bands: str, date: str, venue: str,
         ''', (bands, date, venue, city, str(tags), info, concert_id))
         conn.commit()
         conn.close()
+        _query_concerts.clear()
         return True
     except Exception as e:
         print(f"Error updating concert: {e}")
@@ -158,6 +209,7 @@ def update_concert_likes(concert_id: int, likes_list: List[str]) -> bool:
         c.execute('UPDATE concerts SET likes = ? WHERE id = ?', (str(likes_list), concert_id))
         conn.commit()
         conn.close()
+        _query_concerts.clear()
         return True
     except Exception as e:
         print(f"Error updating concert likes: {e}")
@@ -171,20 +223,29 @@ def delete_concert(concert_id: int) -> bool:
         c.execute('DELETE FROM concerts WHERE id = ?', (concert_id,))
         conn.commit()
         conn.close()
+        _query_concerts.clear()
         return True
     except Exception as e:
         print(f"Error deleting concert: {e}")
         return False
 
 def delete_past_concerts():
-    """Delete past concerts"""
+    """Delete past concerts (at most once a day per process)"""
+    global _last_concert_purge_day
+    today = datetime.now().strftime('%Y-%m-%d')
+    if _last_concert_purge_day == today:
+        return
     try:
         conn = sqlite3.connect(DB_PATH)
         c = conn.cursor()
-        today = datetime.now().strftime('%Y-%m-%d')
         c.execute('DELETE FROM concerts WHERE date < ?', (today,))
+        deleted = c.rowcount
         conn.commit()
         conn.close()
+        _last_concert_purge_day = today
+        # Only drop the cached list if something changed
+        if deleted:
+            _query_concerts.clear()
     except Exception as e:
         print(f"Error cleaning concerts: {e}")
 
@@ -209,6 +270,30 @@ def save_discovery(username: str, base_artist: str, base_album: str,
         print(f"Error saving discovery: {e}")
         return False
 
+# Write-behind queue so discoveries are saved off the request path
+_discovery_queue: "queue.Queue[dict]" = queue.Queue()
+_discovery_writer: Optional[threading.Thread] = None
+_discovery_writer_lock = threading.Lock()
+
+def _discovery_writer_loop():
+    """Drain queued discoveries into the database, one at a time"""
+    while True:
+        discovery = _discovery_queue.get()
+        try:
+            save_discovery(**discovery)
+        finally:
+            _discovery_queue.task_done()
+
+def save_discovery_async(**discovery) -> None:
+    """Queue a discovery for a background save (same arguments as save_discovery)"""
+    global _discovery_writer
+    with _discovery_writer_lock:
+        if _discovery_writer is None or not _discovery_writer.is_alive():
+            _discovery_writer = threading.Thread(target=_discovery_writer_loop,
+                                                 name="discovery-writer", daemon=True)
+            _discovery_writer.start()
+    _discovery_queue.put(discovery)
+
 def load_discoveries(username: Optional[str] = None) -> List[AlbumDiscovery]:
     """Load album discoveries, optionally filtered by username"""
     try:
@@ -3,14 +3,18 @@
 # BANDCAMP SERVICE
 # ===========================
 
+import logging
 import requests
+from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 from typing import Optional, Dict
 
+logger = logging.getLogger(__name__)
+
 def bandcamp_search(artist: str, record: str) -> Optional[Dict]:
     """Scrape Bandcamp search results and return first match"""
     try:
-        q = f"{artist} {record}".replace(" ", "+")
+        q = quote_plus(f"{artist} {record}")
         url = f"https://bandcamp.com/search?q={q}&item_type=a"
         res = requests.get(url, timeout=15)
         res.raise_for_status()
@@ -29,6 +33,6 @@ def bandcamp_search(artist: str, record: str) -> Optional[Dict]:
                 "url": clean,
             }
     except Exception as e:
-        print(f"Error searching Bandcamp: {e}")
+        logger.warning("Error searching Bandcamp: %s", e)
         pass
     return None
\ No newline at end of file
@@ -3,13 +3,33 @@
 # LAST.FM API SERVICE
 # ===========================
 
+import logging
 import streamlit as st
-import pylast
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List
+from config import RELATED_ARTISTS_CACHE_TTL
+from services.spotify_service import clean_artist_name
+
+logger = logging.getLogger(__name__)
+
+LASTFM_API_URL = "https://ws.audioscrobbler.com/2.0/"
+
+# Shared session so bulk tag lookups reuse pooled keep-alive connections
+_lastfm_session = requests.Session()
+_lastfm_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+# Cap in-flight tag requests across all sessions to stay within Last.fm's rate limits
+LASTFM_MAX_CONCURRENT_REQUESTS = 6
+_lastfm_semaphore = threading.Semaphore(LASTFM_MAX_CONCURRENT_REQUESTS)
 
 @st.cache_resource
 def get_lastfm_client():
     """Initialize Last.fm client with credentials from secrets"""
+    # Imported here so pages that never touch Last.fm don't pay for loading it
+    import pylast
+    
     try:
         api_key = st.secrets.get("LASTFM_API_KEY", "")
         api_secret = st.secrets.get("LASTFM_API_SECRET", "")
@@ -25,16 +45,44 @@ def get_lastfm_client():
 
 def get_related_artists_lastfm(lastfm_client, artist_name: str) -> List[str]:
     """Find related artists using Last.fm API"""
-    from services.spotify_service import clean_artist_name
     artist_name = clean_artist_name(artist_name)
     
     try:
         if not lastfm_client:
             return []
-        
-        artist = lastfm_client.get_artist(artist_name)
-        similar = artist.get_similar(limit=15)
-        return [a.item.get_name() for a in similar]
+        return _fetch_related_artists_lastfm(lastfm_client, artist_name)
     except Exception as e:
-        print(f"Error getting related artists from Last.fm: {e}")
-        return []
\ No newline at end of file
+        logger.warning("Error getting related artists from Last.fm: %s", e)
+        return []
+
+# Related artists rarely change; the client is left out of the cache key
+@st.cache_data(ttl=RELATED_ARTISTS_CACHE_TTL, show_spinner=False)
+def _fetch_related_artists_lastfm(_lastfm_client, artist_name: str) -> List[str]:
+    """Fetch similar artist names from Last.fm"""
+    artist = _lastfm_client.get_artist(artist_name)
+    similar = artist.get_similar(limit=15)
+    return [a.item.get_name() for a in similar]
+
+def get_artist_top_tags(api_key: str, artist_name: str, limit: int = 15) -> List[str]:
+    """
+    Fetch an artist's top tag names straight from the Last.fm JSON API
+    Lighter than pylast's per-request XML round-trip for bulk checks
+    """
+    with _lastfm_semaphore:
+        response = _lastfm_session.get(LASTFM_API_URL, params={
+            'method': 'artist.getTopTags',
+            'artist': artist_name,
+            'api_key': api_key,
+            'format': 'json'
+        }, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    
+    if 'error' in data:
+        raise ValueError(data.get('message', f"Last.fm error {data['error']}"))
+    
+    tags = data.get('toptags', {}).get('tag', [])
+    if isinstance(tags, dict):
+        # A single tag comes back as an object instead of a list
+        tags = [tags]
+    return [tag['name'] for tag in tags[:limit]]
\ No newline at end of file
@@ -3,11 +3,18 @@
 # METADATA EXTRACTION SERVICE
 # ===========================
 
+import logging
 import re
 import requests
+import streamlit as st
 from bs4 import BeautifulSoup
 from typing import Optional, Dict
-from config import PLATFORMS
+from config import PLATFORMS, METADATA_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# "... by <artist>" at the end of an og:description, or "by <artist> on <platform>"
+BY_ARTIST_RE = re.compile(r'by (.+?)$|by (.+?) on', re.IGNORECASE)
 
 def detect_platform(url: str) -> str:
     """Detect platform based on domain"""
@@ -28,7 +35,7 @@ def extract_artist(metadata: Dict, platform: str) -> str:
             return parts[-1].strip()
     
     if 'by' in description:
-        match = re.search(r'by (.+?)$|by (.+?) on', description, re.IGNORECASE)
+        match = BY_ARTIST_RE.search(description)
         if match:
             return match.group(1) or match.group(2)
     
@@ -55,53 +62,59 @@ def extract_og_metadata(url: str) -> Optional[Dict]:
     UNIVERSAL extractor using Open Graph metadata
     Works with ANY platform (Spotify, Bandcamp, Tidal, Apple Music, etc.)
     Similar to how WhatsApp/Discord/Twitter does it
+    Results are cached per URL for METADATA_CACHE_TTL seconds
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, timeout=8, headers=headers)
-        response.encoding = 'utf-8'
-        
-        if response.status_code != 200:
-            return None
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        metadata = {}
-        
-        # Look for Open Graph meta tags
-        for meta in soup.find_all('meta', property=True):
-            prop = meta.get('property', '')
+        return _fetch_og_metadata(url)
+    except Exception as e:
+        logger.warning("Error extracting metadata from %s: %s", url, e)
+        return None
+
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def _fetch_og_metadata(url: str) -> Optional[Dict]:
+    """Fetch and parse a page's Open Graph metadata"""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    response = requests.get(url, timeout=8, headers=headers)
+    response.encoding = 'utf-8'
+    
+    if response.status_code != 200:
+        raise requests.HTTPError(f"HTTP {response.status_code}")
+    
+    soup = BeautifulSoup(response.text, 'html.parser')
+    metadata = {}
+    
+    # Look for Open Graph meta tags
+    for meta in soup.find_all('meta', property=True):
+        prop = meta.get('property', '')
+        content = meta.get('content', '')
+        if prop == 'og:title':
+            metadata['og_title'] = content
+        elif prop == 'og:description':
+            metadata['og_description'] = content
+        elif prop == 'og:image':
+            metadata['og_image'] = content
+    
+    # Fallback: look for meta name
+    if not metadata.get('og_title'):
+        for meta in soup.find_all('meta'):
+            name = meta.get('name', '')
             content = meta.get('content', '')
-            if prop == 'og:title':
-                metadata['og_title'] = content
-            elif prop == 'og:description':
+            if name.lower() == 'description':
                 metadata['og_description'] = content
-            elif prop == 'og:image':
+            elif name.lower() == 'twitter:title':
+                metadata['og_title'] = content
+            elif name.lower() == 'twitter:image':
                 metadata['og_image'] = content
-        
-        # Fallback: look for meta name
-        if not metadata.get('og_title'):
-            for meta in soup.find_all('meta'):
-                name = meta.get('name', '')
-                content = meta.get('content', '')
-                if name.lower() == 'description':
-                    metadata['og_description'] = content
-                elif name.lower() == 'twitter:title':
-                    metadata['og_title'] = content
-                elif name.lower() == 'twitter:image':
-                    metadata['og_image'] = content
-        
-        if not metadata.get('og_title'):
-            return None
-        
-        platform = detect_platform(url)
-        return {
-            'artist': extract_artist(metadata, platform),
-            'album_name': extract_album(metadata, platform),
-            'cover_url': metadata.get('og_image', ''),
-            'platform': platform
-        }
-    except Exception as e:
-        print(f"Error extracting metadata from {url}: {e}")
-        return None
\ No newline at end of file
+    
+    if not metadata.get('og_title'):
+        return None
+    
+    platform = detect_platform(url)
+    return {
+        'artist': extract_artist(metadata, platform),
+        'album_name': extract_album(metadata, platform),
+        'cover_url': metadata.get('og_image', ''),
+        'platform': platform
+    }
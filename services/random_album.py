@@ -3,71 +3,181 @@
 # RANDOM ALBUM DISCOVERY SERVICE
 # ===========================
 
+import logging
 import streamlit as st
 import random
+import re
+import sys
+import threading
 import time
-import difflib
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from rapidfuzz import fuzz, process
 from typing import Optional, Dict, Tuple, List
-from database.operations import load_albums, save_discovery
-from services.spotify_service import get_spotify_client, get_related_artists_spotify, get_random_album_by_artist
-from services.lastfm_service import get_lastfm_client, get_related_artists_lastfm
+from database.operations import load_random_album, save_discovery_async
+from services.spotify_service import get_spotify_client, get_related_artists_spotify, get_random_album_by_artist, clean_artist_name
+from services.lastfm_service import get_lastfm_client, get_related_artists_lastfm, get_artist_top_tags
 from services.bandcamp_service import bandcamp_search
 
+logger = logging.getLogger(__name__)
+
 # Strict metal validation keywords
 METAL_KEYWORDS = ['metal', 'grind', 'metalcore', 'heavy', 'death', 'black', 'thrash', 
                   'doom', 'power', 'sludge', 'stoner', 'progressive metal', 'deathcore']
+# All keywords as one compiled pattern, so each tag is scanned in a single pass
+METAL_RE = re.compile('|'.join(map(re.escape, METAL_KEYWORDS)))
+# Most common metal tags on Last.fm, checked by exact match before the regex scan
+METAL_EXACT_TAGS = frozenset({'metal', 'heavy metal', 'death metal', 'black metal', 'thrash metal',
+                              'doom metal', 'power metal', 'sludge metal', 'stoner metal',
+                              'progressive metal', 'metalcore', 'deathcore', 'grindcore'})
+
+def name_similarity(name_a: str, name_b: str, threshold: float = 0.0) -> float:
+    """
+    Case-insensitive similarity between two artist names (0.0 - 1.0)
+    Returns 0.0 when the score is below threshold
+    """
+    name_a = name_a.lower()
+    name_b = name_b.lower()
+    if name_a == name_b:
+        return 1.0
+    
+    # The ratio can never exceed 2 * min_len / (len_a + len_b), so very
+    # different lengths can be rejected without running the comparison
+    len_a, len_b = len(name_a), len(name_b)
+    if 2 * min(len_a, len_b) < threshold * (len_a + len_b):
+        return 0.0
+    
+    # The ratio is symmetric, so order the pair to share one cache slot
+    if name_b < name_a:
+        name_a, name_b = name_b, name_a
+    similarity = _normalized_ratio(name_a, name_b)
+    return similarity if similarity >= threshold else 0.0
+
+@lru_cache(maxsize=2048)
+def _normalized_ratio(name_a: str, name_b: str) -> float:
+    """Memoized rapidfuzz ratio (0.0 - 1.0) for already-lowercased names"""
+    return fuzz.ratio(name_a, name_b) / 100.0
+
+# Concurrent Last.fm requests when checking related artists
+LASTFM_MAX_WORKERS = 8
+
+# Discovery candidates tried concurrently per round of attempts
+DISCOVERY_BATCH_SIZE = 4
+
+# Longest a validated candidate waits on its Bandcamp search before going without a link
+BANDCAMP_WAIT_TIMEOUT = 5  # seconds
+
+# Longest a "Discover Another" click waits on its prefetch before searching directly
+PREFETCH_WAIT_TIMEOUT = 60  # seconds
+
+# Process-level cache of Last.fm artist lookups
+# normalized name -> (fetched_at, tag_names)
+LASTFM_CACHE_TTL = 3600
+_LASTFM_CACHE: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+# (album name, artist name) -> (fetched_at, search result)
+_LASTFM_SEARCH_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[Dict]]] = {}
+# normalized name -> (fetched_at, similar artist names, best match first)
+_LASTFM_SIMILAR_CACHE: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+# Entries kept per Last.fm cache; expired entries are dropped first, then the oldest
+LASTFM_CACHE_MAX_ENTRIES = 4096
+_lastfm_cache_lock = threading.Lock()
+
+def _lastfm_cache_put(cache: Dict, key, value):
+    """Store a Last.fm result with its fetch time, evicting expired and excess entries"""
+    now = time.time()
+    with _lastfm_cache_lock:
+        # Re-insert at the end so the dict stays in fetch order, oldest first
+        cache.pop(key, None)
+        cache[key] = (now, value)
+        while cache:
+            oldest_key, (fetched_at, _) = next(iter(cache.items()))
+            if len(cache) <= LASTFM_CACHE_MAX_ENTRIES and now - fetched_at < LASTFM_CACHE_TTL:
+                break
+            del cache[oldest_key]
+
+# Similar artists fetched per lookup; smaller requests are served from the same list
+LASTFM_SIMILAR_LIMIT = 20
+
+def _cached_artist_tags(lastfm_client, artist_name: str) -> List[str]:
+    """
+    Get an artist's lowercased top tags from Last.fm
+    Results are reused for LASTFM_CACHE_TTL seconds
+    """
+    key = sys.intern(artist_name.strip().lower())
+    cached = _LASTFM_CACHE.get(key)
+    if cached and time.time() - cached[0] < LASTFM_CACHE_TTL:
+        return list(cached[1])
+    
+    tags = get_artist_top_tags(lastfm_client.api_key, artist_name, limit=15)
+    # Tags like "death metal" repeat across many artists; intern them so the
+    # cache holds a single copy of each
+    tag_names = tuple(sys.intern(tag.lower()) for tag in tags)
+    
+    _lastfm_cache_put(_LASTFM_CACHE, key, tag_names)
+    return list(tag_names)
+
+def _cached_similar_artists(lastfm_client, artist_name: str, limit: int = LASTFM_SIMILAR_LIMIT) -> List[str]:
+    """
+    Get the names of an artist's most similar artists on Last.fm
+    Results are reused for LASTFM_CACHE_TTL seconds
+    """
+    key = sys.intern(artist_name.strip().lower())
+    cached = _LASTFM_SIMILAR_CACHE.get(key)
+    if cached and time.time() - cached[0] < LASTFM_CACHE_TTL:
+        return list(cached[1][:limit])
+    
+    similar = lastfm_client.get_artist(artist_name).get_similar(limit=LASTFM_SIMILAR_LIMIT)
+    similar_names = tuple(similar_artist.item.get_name() for similar_artist in similar)
+    
+    _lastfm_cache_put(_LASTFM_SIMILAR_CACHE, key, similar_names)
+    return list(similar_names[:limit])
+
+# Album fields handed to the discovery flow (and stored as its origin)
+WALL_ALBUM_FIELDS = ('id', 'username', 'url', 'artist', 'album_name', 'cover_url',
+                     'platform', 'tags', 'likes', 'timestamp')
+_get_wall_album_fields = attrgetter(*WALL_ALBUM_FIELDS)
 
 def get_random_album_from_wall() -> Optional[Dict]:
     """Get a random album from the wall"""
     try:
-        albums = load_albums()
-        if albums:
-            album = random.choice(albums)
-            return {
-                'id': album.id,
-                'username': album.username,
-                'url': album.url,
-                'artist': album.artist,
-                'album_name': album.album_name,
-                'cover_url': album.cover_url,
-                'platform': album.platform,
-                'tags': album.tags,
-                'likes': album.likes,
-                'timestamp': album.timestamp
-            }
+        album = load_random_album()
+        if album:
+            return dict(zip(WALL_ALBUM_FIELDS, _get_wall_album_fields(album)))
         return None
     except Exception as e:
         st.error(f"Error getting random album: {e}")
         return None
 
-def is_metal_artist(lastfm_client, artist_name: str) -> Tuple[bool, List[str]]:
+def count_metal_tags(tag_names: List[str]) -> int:
+    """Count the tags that contain a metal keyword"""
+    return sum(1 for tag in tag_names if METAL_RE.search(tag))
+
+def is_metal_artist(lastfm_client, artist_name: str, tags: Optional[List[str]] = None) -> Tuple[bool, List[str]]:
     """
     Strict check if an artist is a metal artist using Last.fm tags
+    Pass already-fetched lowercased tags to skip the Last.fm lookup
     Returns: (is_metal, list_of_tags)
     """
     if not lastfm_client:
         return False, []
     
     try:
-        # Get artist info from Last.fm
-        artist = lastfm_client.get_artist(artist_name)
-        
-        # Get top tags for the artist
-        tags = artist.get_top_tags(limit=15)
-        
-        # Convert tags to lowercase for comparison
-        tag_names = [tag.item.get_name().lower() for tag in tags]
+        # Get lowercased top tags for the artist (cached)
+        if tags is None:
+            tag_names = _cached_artist_tags(lastfm_client, artist_name)
+        else:
+            tag_names = tags
         
-        # STRICT metal validation - check for specific metal keywords
-        for tag in tag_names:
-            for keyword in METAL_KEYWORDS:
-                if keyword in tag:
-                    return True, tag_names
+        # Fast path: most metal artists carry one of the common tags verbatim
+        if not METAL_EXACT_TAGS.isdisjoint(tag_names):
+            return True, tag_names
         
-        return False, tag_names
+        # STRICT metal validation - stop at the first tag with a metal keyword
+        return any(map(METAL_RE.search, tag_names)), tag_names
         
     except Exception as e:
-        print(f"Error checking if {artist_name} is metal: {e}")
+        logger.warning("Error checking if %s is metal: %s", artist_name, e)
         return False, []
 
 def search_lastfm_artist(lastfm_client, album_name: str, artist_name: str) -> Optional[Dict]:
@@ -78,6 +188,11 @@ def search_lastfm_artist(lastfm_client, album_name: str, artist_name: str) -> Op
     if not lastfm_client:
         return None
     
+    key = (album_name.strip().lower(), artist_name.strip().lower())
+    cached = _LASTFM_SEARCH_CACHE.get(key)
+    if cached and time.time() - cached[0] < LASTFM_CACHE_TTL:
+        return cached[1]
+    
     try:
         # Search for the album
         search_results = lastfm_client.search_for_album(album_name, artist_name)
@@ -86,27 +201,29 @@ def search_lastfm_artist(lastfm_client, album_name: str, artist_name: str) -> Op
             # Try searching just by album name
             search_results = lastfm_client.search_for_album(album_name)
         
+        result = None
         if search_results and len(search_results) > 0:
             # Get the first result
             album = search_results[0]
             
-            # Get the artist
+            # Get the artist and its tags (cached)
             artist = album.get_artist()
             artist_name_corrected = artist.get_name()
+            tag_names = _cached_artist_tags(lastfm_client, artist_name_corrected)
             
-            # Get artist tags
-            tags = artist.get_top_tags(limit=15)
-            tag_names = [tag.item.get_name().lower() for tag in tags]
-            
-            return {
+            result = {
                 'artist': artist_name_corrected,
                 'tags': tag_names,
                 'album': album.get_name(),
                 'mbid': album.get_mbid() if hasattr(album, 'get_mbid') else None
             }
+        
+        # Cache misses too, so an unknown album isn't searched for again
+        _lastfm_cache_put(_LASTFM_SEARCH_CACHE, key, result)
+        return result
     
     except Exception as e:
-        print(f"Error searching Last.fm for {artist_name} - {album_name}: {e}")
+        logger.warning("Error searching Last.fm for %s - %s: %s", artist_name, album_name, e)
     
     return None
 
@@ -128,13 +245,12 @@ def validate_and_correct_metal_album(lastfm_client, spotify_album_data: Dict, or
     if is_metal:
         # DOUBLE CHECK: Verify artist name match is close enough
         if original_artist:
-            similarity = difflib.SequenceMatcher(None, artist_name.lower(), original_artist.lower()).ratio()
+            similarity = name_similarity(artist_name, original_artist, 0.7)
             if similarity < 0.7:  # 70% similarity threshold
                 return None, False, f"Artist name mismatch: '{artist_name}' vs '{original_artist}'"
         
         # Additional verification: check if metal tags are prominent
-        metal_tag_count = sum(1 for tag in spotify_artist_tags 
-                            if any(keyword in tag for keyword in METAL_KEYWORDS))
+        metal_tag_count = count_metal_tags(spotify_artist_tags)
         
         if metal_tag_count >= 1:  # At least one strong metal tag
             return spotify_album_data, True, f"✅ Validated as metal ({metal_tag_count} metal tags found)"
@@ -148,13 +264,13 @@ def validate_and_correct_metal_album(lastfm_client, spotify_album_data: Dict, or
         corrected_artist = lastfm_info['artist']
         tags = lastfm_info['tags']
         
-        # Step 3: DOUBLE CHECK the corrected artist
-        is_corrected_metal, corrected_tags = is_metal_artist(lastfm_client, corrected_artist)
+        # Step 3: DOUBLE CHECK the corrected artist (tags came with the search result)
+        is_corrected_metal, corrected_tags = is_metal_artist(lastfm_client, corrected_artist, tags)
         
         if is_corrected_metal:
             # Verify artist name similarity
             if original_artist:
-                similarity = difflib.SequenceMatcher(None, corrected_artist.lower(), original_artist.lower()).ratio()
+                similarity = name_similarity(corrected_artist, original_artist, 0.7)
                 if similarity < 0.7:
                     return None, False, f"Corrected artist name mismatch: '{corrected_artist}' vs '{original_artist}'"
             
@@ -162,33 +278,55 @@ def validate_and_correct_metal_album(lastfm_client, spotify_album_data: Dict, or
             spotify_album_data['artist'] = corrected_artist
             spotify_album_data['lastfm_tags'] = corrected_tags
             
-            metal_tag_count = sum(1 for tag in corrected_tags 
-                                if any(keyword in tag for keyword in METAL_KEYWORDS))
+            metal_tag_count = count_metal_tags(corrected_tags)
             
             return spotify_album_data, True, f"✅ Corrected and validated as metal ({metal_tag_count} metal tags)"
     
     # Step 4: Check for similar artists that are metal
     try:
-        artist = lastfm_client.get_artist(artist_name)
-        similar = artist.get_similar(limit=5)
+        similar_names = _cached_similar_artists(lastfm_client, artist_name, limit=5)
         
-        for similar_artist in similar:
-            similar_name = similar_artist.item.get_name()
-            is_similar_metal, similar_tags = is_metal_artist(lastfm_client, similar_name)
-            
-            if is_similar_metal:
-                # Check if original artist name matches similar metal artist
-                similarity = difflib.SequenceMatcher(None, artist_name.lower(), similar_name.lower()).ratio()
-                if similarity > 0.8:  # 80% similarity
-                    metal_tag_count = sum(1 for tag in similar_tags 
-                                        if any(keyword in tag for keyword in METAL_KEYWORDS))
-                    return spotify_album_data, True, f"✅ Validated via similar artist ({metal_tag_count} metal tags)"
+        # Score all names in one call first - it is much cheaper than a Last.fm lookup
+        matches = process.extract(artist_name, similar_names, scorer=fuzz.ratio,
+                                  processor=str.lower, score_cutoff=80, limit=None)
+        
+        close_names = [similar_name for similar_name, score, _ in matches if score > 80]  # 80% similarity
+        
+        # Check the close matches concurrently, keeping the best-scored metal one
+        metal_similar = filter_metal_artists(lastfm_client, close_names, max_results=1)
+        if metal_similar:
+            # Tags are already cached by the check above
+            _, similar_tags = is_metal_artist(lastfm_client, metal_similar[0])
+            metal_tag_count = count_metal_tags(similar_tags)
+            return spotify_album_data, True, f"✅ Validated via similar artist ({metal_tag_count} metal tags)"
     
     except Exception:
         pass
     
     return None, False, "Not a validated metal artist"
 
+def filter_metal_artists(lastfm_client, artist_names: List[str], max_results: Optional[int] = None) -> List[str]:
+    """
+    Keep only the metal artists, checking their Last.fm tags concurrently
+    Preserves the input order and stops once max_results are found
+    """
+    metal_artists = []
+    # No with-block: its exit would wait for every lookup still running after an early stop
+    executor = ThreadPoolExecutor(max_workers=LASTFM_MAX_WORKERS)
+    try:
+        checks = executor.map(lambda name: is_metal_artist(lastfm_client, name)[0], artist_names)
+        for artist_name, is_metal in zip(artist_names, checks):
+            if is_metal:
+                metal_artists.append(artist_name)
+                
+                if max_results and len(metal_artists) >= max_results:
+                    break
+    finally:
+        # Queued lookups are cancelled; running ones finish in the background and still fill the cache
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return metal_artists
+
 def get_metal_related_artists(lastfm_client, base_artist: str, max_results: int = 10) -> List[str]:
     """
     Get related artists and filter to only metal ones
@@ -197,30 +335,120 @@ def get_metal_related_artists(lastfm_client, base_artist: str, max_results: int
         return []
     
     try:
-        # Get all related artists
-        artist = lastfm_client.get_artist(base_artist)
-        similar = artist.get_similar(limit=20)
-        
-        # Filter to only metal artists
-        metal_related = []
-        for similar_artist in similar:
-            artist_name = similar_artist.item.get_name()
-            is_metal, tags = is_metal_artist(lastfm_client, artist_name)
-            
-            if is_metal:
-                metal_related.append(artist_name)
-                
-                if len(metal_related) >= max_results:
-                    break
+        # Get all related artists (cached)
+        similar_names = _cached_similar_artists(lastfm_client, base_artist)
         
-        return metal_related
+        # Filter to only metal artists, keeping Last.fm's similarity order
+        return filter_metal_artists(lastfm_client, similar_names, max_results)
         
     except Exception as e:
-        print(f"Error getting metal related artists: {e}")
+        logger.warning("Error getting metal related artists: %s", e)
         return []
 
+def _try_candidate(spotify_client, lastfm_client, artist_name: str,
+                   bandcamp_executor: ThreadPoolExecutor) -> Optional[Tuple[Dict, Optional[str], Optional[float], Optional[Dict]]]:
+    """
+    Fetch and validate a random album for one metal-related artist
+    Runs in a worker thread, so it must not touch Streamlit state
+    Returns: (album_data, validation_message, similarity, bandcamp_match) or None if the candidate failed
+    """
+    # Step 5: Get random album from Spotify
+    album_data = None
+    if spotify_client:
+        album_data = get_random_album_by_artist(spotify_client, artist_name)
+    
+    if not album_data:
+        return None
+    
+    if not lastfm_client:
+        # Can't validate without Last.fm
+        return album_data, None, None, None
+    
+    # Step 8 (early): search Bandcamp while validation runs - validation may
+    # rename the artist in album_data, so keep the name that was searched
+    bandcamp_artist = album_data["artist"]
+    try:
+        bandcamp_future = bandcamp_executor.submit(bandcamp_search, bandcamp_artist, album_data["album"])
+    except RuntimeError:
+        # The batch already has a winner and its executor is shut down
+        return None
+    
+    # Step 6: STRICT validation with double checking
+    validated_album, is_valid, validation_msg = validate_and_correct_metal_album(
+        lastfm_client, album_data, artist_name
+    )
+    if not (is_valid and validated_album):
+        bandcamp_future.cancel()
+        return None
+    
+    # Step 7: FINAL VERIFICATION - Double check artist name match
+    similarity = name_similarity(validated_album.get("artist", ""), artist_name, 0.6)
+    if similarity < 0.6:  # Strict final check
+        bandcamp_future.cancel()
+        return None
+    
+    if validated_album["artist"] == bandcamp_artist:
+        try:
+            bandcamp_match = bandcamp_future.result(timeout=BANDCAMP_WAIT_TIMEOUT)
+        except FutureTimeout:
+            logger.warning("Bandcamp search for %s timed out", bandcamp_artist)
+            bandcamp_future.cancel()
+            bandcamp_match = None
+    else:
+        # Validation corrected the artist, so search again under the new name
+        bandcamp_future.cancel()
+        bandcamp_match = bandcamp_search(validated_album["artist"], validated_album["album"])
+    
+    return validated_album, validation_msg, similarity, bandcamp_match
+
+def record_discovery(discovery_data: Dict):
+    """Save a discovery to the logged-in user's history in the background"""
+    if st.session_state.get('current_user'):
+        origin = discovery_data["origin"]
+        discovery = discovery_data["discovery"]
+        save_discovery_async(
+            username=st.session_state.current_user,
+            base_artist=origin["artist"],
+            base_album=origin["album_name"],
+            discovered_artist=discovery["artist"],
+            discovered_album=discovery["album"],
+            discovered_url=discovery["url"],
+            cover_url=discovery.get("image")
+        )
+
+def prefetch_next_discovery(base_artist: str, base_album_obj: Dict) -> Optional[Future]:
+    """
+    Start the next discovery from the same base album in the background
+    Each prefetch gets its own worker thread, so it never queues behind another session's
+    The result is not saved to history; call record_discovery once it is shown
+    """
+    # Without both clients a discovery can't be validated, so there is nothing worth preparing
+    if not (get_spotify_client() and get_lastfm_client()):
+        return None
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(discover_random_album, base_artist, base_album_obj, record=False)
+    # The worker thread exits once this one job is done
+    executor.shutdown(wait=False)
+    return future
+
+def take_prefetched_discovery(future: Future) -> Optional[Tuple[Optional[Dict], Optional[str]]]:
+    """
+    Result of a prefetch from prefetch_next_discovery, or None to search directly instead
+    A prefetch already under way is ahead of a fresh search, so it is waited on (bounded)
+    """
+    if not (future.done() or future.running()):
+        return None
+    try:
+        return future.result(timeout=PREFETCH_WAIT_TIMEOUT)
+    except FutureTimeout:
+        logger.warning("Discovery prefetch still running after %s s, searching directly", PREFETCH_WAIT_TIMEOUT)
+        return None
+    except Exception as e:
+        logger.warning("Discovery prefetch failed: %s", e)
+        return None
+
 def discover_random_album(base_artist: Optional[str] = None, base_album_obj: Optional[Dict] = None, 
-                         max_attempts: int = 10) -> Tuple[Optional[Dict], Optional[str]]:
+                         max_attempts: int = 10, record: bool = True) -> Tuple[Optional[Dict], Optional[str]]:
     """
     Main random discovery function with STRICT metal validation and double checking
     """
@@ -241,17 +469,18 @@ def discover_random_album(base_artist: Optional[str] = None, base_album_obj: Opt
         base_album_name = random_album.get('album_name', '')
         
         # Clean artist name
-        from services.spotify_service import clean_artist_name
         base_artist_name_clean = clean_artist_name(base_artist_name)
         
         if not base_artist_name_clean:
             return None, "Could not extract artist from album"
         
         # Step 2: DOUBLE VALIDATION - Check if base artist itself is metal
+        # Returned with the discovery rather than drawn here, as prefetches run without a session
+        base_warning = None
         if lastfm_client:
             is_base_metal, base_tags = is_metal_artist(lastfm_client, base_artist_name_clean)
             if not is_base_metal:
-                st.warning(f"Warning: Base artist '{base_artist_name_clean}' may not be metal. Continuing anyway.")
+                base_warning = f"Warning: Base artist '{base_artist_name_clean}' may not be metal. Continuing anyway."
         
         # Step 3: Find metal-related artists only
         metal_related_artists = []
@@ -264,110 +493,94 @@ def discover_random_album(base_artist: Optional[str] = None, base_album_obj: Opt
         if not metal_related_artists and spotify_client:
             all_related = get_related_artists_spotify(spotify_client, base_artist_name_clean)
             # Filter Spotify results through Last.fm validation
-            for artist in all_related[:10]:  # Check first 10
-                if lastfm_client:
-                    is_metal, _ = is_metal_artist(lastfm_client, artist)
-                    if is_metal:
-                        metal_related_artists.append(artist)
+            if lastfm_client:
+                metal_related_artists = filter_metal_artists(lastfm_client, all_related[:10])  # Check first 10
         
         if not metal_related_artists:
             return None, f"No metal-related artists found for {base_artist_name_clean}"
         
-        # Try multiple attempts to find a valid metal album
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            
-            # Step 4: Pick random metal-related artist
-            random_metal_artist = random.choice(metal_related_artists)
+        # Step 4: Queue up random metal-related artists - each is tried at most once
+        candidates = random.sample(metal_related_artists, min(max_attempts, len(metal_related_artists)))
+        
+        # Try multiple attempts to find a valid metal album, a batch at a time
+        for start in range(0, len(candidates), DISCOVERY_BATCH_SIZE):
+            batch = candidates[start:start + DISCOVERY_BATCH_SIZE]
             
-            # Step 5: Get random album from Spotify
-            random_album_data = None
-            if spotify_client:
-                random_album_data = get_random_album_by_artist(spotify_client, random_metal_artist)
+            # Steps 5-7 run concurrently; the first candidate to pass wins
+            result = None
+            # No with-block: its exit would join the losing candidates we stop waiting for
+            executor = ThreadPoolExecutor(max_workers=len(batch))
+            # Bandcamp searches of this batch only, so other sessions' scrapes never queue ahead
+            bandcamp_executor = ThreadPoolExecutor(max_workers=len(batch))
+            try:
+                futures = {
+                    executor.submit(_try_candidate, spotify_client, lastfm_client, candidate,
+                                    bandcamp_executor): candidate
+                    for candidate in batch
+                }
+                for future in as_completed(futures):
+                    if future.result():
+                        result = future.result()
+                        random_metal_artist = futures[future]
+                        break
+            finally:
+                # Candidates still running finish in the background; their results are dropped
+                executor.shutdown(wait=False, cancel_futures=True)
+                bandcamp_executor.shutdown(wait=False, cancel_futures=True)
             
-            # If Spotify fails, skip this attempt
-            if not random_album_data:
+            if not result:
                 continue
             
-            # Step 6: STRICT validation with double checking
+            random_album_data, validation_msg, similarity, bc_search_result = result
+            
             if lastfm_client:
-                validated_album, is_valid, validation_msg = validate_and_correct_metal_album(
-                    lastfm_client, random_album_data, random_metal_artist
-                )
+                validated_album = random_album_data
+                final_artist = validated_album.get("artist", "")
                 
-                if is_valid and validated_album:
-                    # Step 7: FINAL VERIFICATION - Double check artist name match
-                    final_artist = validated_album.get("artist", "")
-                    similarity = difflib.SequenceMatcher(None, 
-                                                        final_artist.lower(), 
-                                                        random_metal_artist.lower()).ratio()
-                    
-                    if similarity < 0.6:  # Strict final check
-                        continue  # Try another attempt
-                    
-                    # Step 8: Try to find the album on Bandcamp
-                    bandcamp_result = None
-                    try:
-                        bc_search_result = bandcamp_search(
-                            validated_album["artist"], 
-                            validated_album["album"]
-                        )
-                        if bc_search_result:
-                            bandcamp_result = {
-                                "url": bc_search_result["url"],
-                                "artist": bc_search_result["artist"],
-                                "album": bc_search_result["album"]
-                            }
-                    except Exception:
-                        pass
-                    
-                    # Prepare discovery data with validation info
-                    discovery_data = {
-                        "origin": {
-                            "album": random_album,
-                            "artist": base_artist_name,
-                            "album_name": base_album_name
-                        },
-                        "discovery": {
-                            **validated_album,
-                            "validated_artist": final_artist,
-                            "original_searched_artist": random_metal_artist
-                        },
-                        "bandcamp": bandcamp_result,
-                        "description": f"Based on '{base_album_name}' by {base_artist_name} → Metal-related artist: {random_metal_artist}",
-                        "validation": validation_msg,
-                        "similarity_score": f"{similarity:.1%} artist match"
+                # Step 8: Bandcamp match found while the candidate was validated
+                bandcamp_result = None
+                if bc_search_result:
+                    bandcamp_result = {
+                        "url": bc_search_result["url"],
+                        "artist": bc_search_result["artist"],
+                        "album": bc_search_result["album"]
                     }
-                    
-                    # Save discovery to database if user is logged in
-                    if st.session_state.get('current_user'):
-                        save_discovery(
-                            username=st.session_state.current_user,
-                            base_artist=base_artist_name,
-                            base_album=base_album_name,
-                            discovered_artist=validated_album["artist"],
-                            discovered_album=validated_album["album"],
-                            discovered_url=validated_album["url"],
-                            cover_url=validated_album.get("image")
-                        )
-                    
-                    return discovery_data, None
-                else:
-                    # Not a valid metal album, try again
-                    continue
+                
+                # Prepare discovery data with validation info
+                discovery_data = {
+                    "origin": {
+                        "album": random_album,
+                        "artist": base_artist_name,
+                        "album_name": base_album_name
+                    },
+                    "discovery": {
+                        **validated_album,
+                        "validated_artist": final_artist,
+                        "original_searched_artist": random_metal_artist
+                    },
+                    "bandcamp": bandcamp_result,
+                    "description": f"Based on '{base_album_name}' by {base_artist_name} → Metal-related artist: {random_metal_artist}",
+                    "validation": validation_msg,
+                    "similarity_score": f"{similarity:.1%} artist match",
+                    "warning": base_warning
+                }
+                
+                # Save discovery to database in the background if user is logged in
+                if record:
+                    record_discovery(discovery_data)
+                
+                return discovery_data, None
             else:
                 # No Last.fm client, can't validate - create basic discovery with warning
                 bandcamp_result = None
                 try:
-                    if random_album_data:
-                        bc_search_result = bandcamp_search(random_metal_artist, random_album_data["album"])
-                        if bc_search_result:
-                            bandcamp_result = {
-                                "url": bc_search_result["url"],
-                                "artist": bc_search_result["artist"],
-                                "album": bc_search_result["album"]
-                            }
+                    bc_search_result = bandcamp_search(random_metal_artist, random_album_data["album"])
+                    if bc_search_result:
+                        bandcamp_result = {
+                            "url": bc_search_result["url"],
+                            "artist": bc_search_result["artist"],
+                            "album": bc_search_result["album"]
+                        }
                 except Exception:
                     pass
                 
@@ -381,13 +594,14 @@ def discover_random_album(base_artist: Optional[str] = None, base_album_obj: Opt
                     "bandcamp": bandcamp_result,
                     "description": f"Based on '{base_album_name}' by {base_artist_name} → Related artist: {random_metal_artist}",
                     "validation": "⚠️ No Last.fm validation available",
-                    "similarity_score": "Unknown"
+                    "similarity_score": "Unknown",
+                    "warning": base_warning
                 }
                 
                 return discovery_data, None
         
         # If we get here, we couldn't find a valid metal album after max attempts
-        return None, f"Could not find a validated metal album after {max_attempts} attempts. Try again!"
+        return None, f"Could not find a validated metal album after {len(candidates)} attempts. Try again!"
         
     except Exception as e:
         return None, f"Error during discovery: {str(e)}"
\ No newline at end of file
@@ -3,15 +3,37 @@
 # SPOTIFY API SERVICE
 # ===========================
 
+import logging
 import streamlit as st
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
 from typing import Optional, Dict, List
+from functools import lru_cache
+import hashlib
+import json
+import os
 import random
+import re
+import threading
+import time
+from config import SPOTIFY_CACHE_DIR, SPOTIFY_CACHE_TTL, RELATED_ARTISTS_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# Cap in-flight Spotify requests across all sessions so bursts don't run into 429s
+SPOTIFY_MAX_CONCURRENT_REQUESTS = 4
+_spotify_semaphore = threading.Semaphore(SPOTIFY_MAX_CONCURRENT_REQUESTS)
+
+# Seconds between sweeps that delete expired album cache files
+SPOTIFY_CACHE_PRUNE_INTERVAL = 60 * 60
+_last_cache_prune = 0.0
+_cache_prune_lock = threading.Lock()
 
 @st.cache_resource
 def get_spotify_client():
     """Initialize Spotify client with credentials from secrets"""
+    # Imported here so pages that never touch Spotify don't pay for loading it
+    import spotipy
+    from spotipy.oauth2 import SpotifyClientCredentials
+    
     try:
         client_id = st.secrets.get("SPOTIFY_CLIENT_ID", "")
         client_secret = st.secrets.get("SPOTIFY_CLIENT_SECRET", "")
@@ -36,21 +58,83 @@ def get_related_artists_spotify(spotify_client, artist_name: str) -> List[str]:
     try:
         if not spotify_client:
             return []
-        
-        results = spotify_client.search(q=f"artist:{artist_name}", type="artist", limit=1)
-        artists = results.get("artists", {}).get("items", [])
-        
-        if not artists:
-            return []
-        
-        artist_id = artists[0]["id"]
-        related_artists = spotify_client.artist_related_artists(artist_id)
-        
-        return [artist["name"] for artist in related_artists.get("artists", [])[:10]]
+        return _fetch_related_artists_spotify(spotify_client, artist_name)
     except Exception as e:
-        print(f"Error getting related artists from Spotify: {e}")
+        logger.warning("Error getting related artists from Spotify: %s", e)
         return []
 
+# Related artists rarely change; the client is left out of the cache key
+@st.cache_data(ttl=RELATED_ARTISTS_CACHE_TTL, show_spinner=False)
+def _fetch_related_artists_spotify(_spotify_client, artist_name: str) -> List[str]:
+    """Fetch related artist names from Spotify"""
+    with _spotify_semaphore:
+        results = _spotify_client.search(q=f"artist:{artist_name}", type="artist", limit=1)
+    artists = results.get("artists", {}).get("items", [])
+    
+    if not artists:
+        return []
+    
+    artist_id = artists[0]["id"]
+    with _spotify_semaphore:
+        related_artists = _spotify_client.artist_related_artists(artist_id)
+    
+    return [artist["name"] for artist in related_artists.get("artists", [])[:10]]
+
+def search_artist_albums(spotify_client, artist_name: str) -> List[Dict]:
+    """
+    Search Spotify for an artist's albums
+    Results are kept on disk for SPOTIFY_CACHE_TTL seconds since they rarely change
+    """
+    key = hashlib.sha1(artist_name.lower().encode()).hexdigest()
+    cache_path = os.path.join(SPOTIFY_CACHE_DIR, f"{key}.json")
+    
+    try:
+        if time.time() - os.path.getmtime(cache_path) < SPOTIFY_CACHE_TTL:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt cache entry - fetch fresh
+        pass
+    
+    with _spotify_semaphore:
+        results = spotify_client.search(q=f"artist:{artist_name}", type="album", limit=20)
+    albums = results.get("albums", {}).get("items", [])
+    
+    try:
+        os.makedirs(SPOTIFY_CACHE_DIR, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(albums, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Error caching Spotify albums for %s: %s", artist_name, e)
+    
+    _prune_album_cache()
+    return albums
+
+def _prune_album_cache():
+    """Delete album cache files past SPOTIFY_CACHE_TTL (at most once per prune interval)"""
+    global _last_cache_prune
+    now = time.time()
+    with _cache_prune_lock:
+        if now - _last_cache_prune < SPOTIFY_CACHE_PRUNE_INTERVAL:
+            return
+        _last_cache_prune = now
+    
+    try:
+        with os.scandir(SPOTIFY_CACHE_DIR) as entries:
+            for entry in entries:
+                # Also catches temp files left behind by an interrupted write
+                try:
+                    if now - entry.stat().st_mtime >= SPOTIFY_CACHE_TTL:
+                        os.remove(entry.path)
+                except OSError:
+                    # Removed by another worker, or still being written
+                    pass
+    except OSError as e:
+        logger.warning("Error pruning Spotify album cache: %s", e)
+
 def get_random_album_by_artist(spotify_client, artist_name: str) -> Optional[Dict]:
     """Get a random album by an artist from Spotify"""
     artist_name = clean_artist_name(artist_name)
@@ -59,18 +143,14 @@ def get_random_album_by_artist(spotify_client, artist_name: str) -> Optional[Dic
         if not spotify_client:
             return None
         
-        results = spotify_client.search(q=f"artist:{artist_name}", type="album", limit=20)
-        albums = results.get("albums", {}).get("items", [])
+        albums = search_artist_albums(spotify_client, artist_name)
         
         if not albums:
             return None
         
-        # Pick random album
-        random_album = random.choice(albums)
-        
-        # Get full album details
-        album_id = random_album["id"]
-        album_details = spotify_client.album(album_id)
+        # Pick random album - search results already carry every field shown,
+        # so no follow-up album request is needed
+        album_details = random.choice(albums)
         
         return {
             "artist": artist_name,
@@ -82,12 +162,15 @@ def get_random_album_by_artist(spotify_client, artist_name: str) -> Optional[Dic
             "genres": album_details.get("genres", [])
         }
     except Exception as e:
-        print(f"Error getting random album from Spotify: {e}")
+        logger.warning("Error getting random album from Spotify: %s", e)
         return None
 
+# Platform-specific text stripped from pasted artist names
+ARTIST_NAME_SUFFIXES = (" | Spotify", "Album by ", "EP by ", "Single by ")
+# All suffixes as one compiled pattern, so a name is cleaned in a single pass
+ARTIST_NAME_SUFFIX_RE = re.compile('|'.join(map(re.escape, ARTIST_NAME_SUFFIXES)))
+
+@lru_cache(maxsize=4096)
 def clean_artist_name(artist_name: str) -> str:
     """Clean artist name by removing platform-specific suffixes"""
-    suffixes = [" | Spotify", "Album by ", "EP by ", "Single by "]
-    for suffix in suffixes:
-        artist_name = artist_name.replace(suffix, "")
-    return artist_name.strip()
\ No newline at end of file
+    return ARTIST_NAME_SUFFIX_RE.sub("", artist_name).strip()
\ No newline at end of file
@@ -7,6 +7,9 @@ import streamlit as st
 from typing import List, Optional
 from datetime import datetime
 
+# Placeholder for album posts without cover art
+NO_COVER_HTML = '<div style="width:100%; height:180px; background:#333; border-radius:8px; display:flex; align-items:center; justify-content:center; color:#666;">No cover</div>'
+
 def render_header():
     """Render the app header with login/logout button"""
     col1, col2 = st.columns([0.8, 0.2])
@@ -53,12 +56,7 @@ def render_login_form():
             st.markdown("You're browsing as a guest. Login to post content.")
         
         # Remove show_login from query params if it exists
-        if 'show_login' in st.query_params:
-            params = dict(st.query_params)
-            del params['show_login']
-            st.query_params.clear()
-            for key, value in params.items():
-                st.query_params[key] = value
+        st.query_params.pop('show_login', None)
         
         # Login form
         with st.form("login_form"):
@@ -99,7 +97,8 @@ def render_navigation():
     
     return page
 
-def render_album_post(album, show_rank: bool = False, rank: Optional[int] = None):
+def render_album_post(album, show_rank: bool = False, rank: Optional[int] = None,
+                      now: Optional[datetime] = None):
     """Display an album post like Twitter/Mastodon with edit functionality"""
     # Check if current user can edit this post
     can_edit = (st.session_state.current_user == "Admin" or 
@@ -114,6 +113,7 @@ def render_album_post(album, show_rank: bool = False, rank: Optional[int] = None
         return
     
     # Normal display (when not editing)
+    from utils.helpers import get_time_ago
     col1, col2 = st.columns([1.3, 3.5])
     
     with col1:
@@ -121,26 +121,31 @@ def render_album_post(album, show_rank: bool = False, rank: Optional[int] = None
             st.markdown(f'<a href="{album.url}" target="_blank" style="text-decoration: none;"><img src="{album.cover_url}" style="width:100%; border-radius:8px; object-fit:cover; height:180px;" class="clickable-image"></a>', 
                        unsafe_allow_html=True)
         else:
-            st.markdown('<div style="width:100%; height:180px; background:#333; border-radius:8px; display:flex; align-items:center; justify-content:center; color:#666;">No cover</div>', unsafe_allow_html=True)
+            st.markdown(NO_COVER_HTML, unsafe_allow_html=True)
     
     with col2:
+        # Rank, artist and album as paragraphs of one markdown element
+        title_lines = [f'**{album.artist}**', f'{album.album_name}']
         if show_rank and rank is not None:
-            st.markdown(f"**#{rank}**")
-        st.markdown(f'**{album.artist}**', unsafe_allow_html=True)
-        st.markdown(f'{album.album_name}', unsafe_allow_html=True)
-        st.caption(f'📱 {album.platform} • {get_time_ago(album.timestamp)} • @{album.username}')
+            title_lines.insert(0, f"**#{rank}**")
+        st.markdown('\n\n'.join(title_lines), unsafe_allow_html=True)
+        st.caption(f'📱 {album.platform} • {get_time_ago(album.timestamp, now)} • @{album.username}')
     
     # Action buttons and tags
     bottom_container = st.container()
     
     with bottom_container:
-        col_tags, col_actions = st.columns([3, 1])
+        # Tags take 3/4 of the row and the buttons share the last quarter,
+        # all in one set of columns rather than columns nested in a column
+        if can_edit:
+            col_tags, *action_cols = st.columns([12, 1, 2, 1])
+        else:
+            col_tags, *action_cols = st.columns([9, 2, 1])
         
         with col_tags:
             render_tag_buttons(album.tags, f"feed_tag_{album.id}")
         
-        with col_actions:
-            render_album_actions(album, can_edit)
+        render_album_actions(album, can_edit, action_cols)
     
     st.divider()
 
@@ -186,15 +191,18 @@ def render_album_edit_form(album):
         
         st.divider()
 
-def render_album_actions(album, can_edit: bool):
-    """Render action buttons for an album post"""
-    from database.operations import update_album_likes, delete_album
+def render_album_actions(album, can_edit: bool, action_cols: List):
+    """
+    Render action buttons for an album post
+    action_cols are (edit, like, delete) columns when can_edit, else (like, delete)
+    """
+    from database.operations import delete_album
     
     is_liked = st.session_state.current_user in album.likes if st.session_state.current_user else False
     current_likes = len(album.likes)
     
     if can_edit:
-        edit_col, like_col, delete_col = st.columns([1, 2, 1])
+        edit_col, like_col, delete_col = action_cols
         
         with edit_col:
             if st.button("✏️", key=f"edit_{album.id}", help="Edit", use_container_width=True):
@@ -210,7 +218,7 @@ def render_album_actions(album, can_edit: bool):
                     st.success("✅ Album deleted successfully!")
                     st.rerun()
     else:
-        like_col, delete_col = st.columns([2, 1])
+        like_col, delete_col = action_cols
         
         with like_col:
             render_like_button(album, is_liked, current_likes, f"like_{album.id}")
@@ -223,35 +231,45 @@ def render_album_actions(album, can_edit: bool):
                         st.success("✅ Album deleted successfully!")
                         st.rerun()
 
-def render_like_button(album, is_liked: bool, current_likes: int, key: str):
-    """Render like button with count"""
+def _toggle_like(album, is_liked: bool):
+    """Like button callback - saves the new likes before the rerun"""
     from database.operations import update_album_likes
     
+    if is_liked:
+        album.likes.remove(st.session_state.current_user)
+    else:
+        album.likes.append(st.session_state.current_user)
+    update_album_likes(album.id, album.likes)
+
+def render_like_button(album, is_liked: bool, current_likes: int, key: str):
+    """Render like button with count"""
     if st.session_state.current_user:
         like_text = f"{'❤️' if is_liked else '🤍'} {current_likes}"
-        if st.button(like_text, key=key, help="Like", use_container_width=True):
-            if is_liked:
-                album.likes.remove(st.session_state.current_user)
-            else:
-                album.likes.append(st.session_state.current_user)
-            update_album_likes(album.id, album.likes)
-            st.rerun()
+        # The click's own rerun redraws the count, so no st.rerun() is needed
+        st.button(like_text, key=key, help="Like", use_container_width=True,
+                  on_click=_toggle_like, args=(album, is_liked))
     else:
         # For guest, just show the likes count
         st.markdown(f"❤️ {current_likes}")
 
 def render_tag_buttons(tags: List[str], key_prefix: str):
-    """Render tag buttons in a horizontal layout"""
+    """Render a post's tags as one row of pills; picking a tag filters the feed"""
     if tags:
-        tag_cols = st.columns(len(tags))
-        for idx, tag in enumerate(tags):
-            with tag_cols[idx]:
-                if st.button(f"#{tag}", key=f"{key_prefix}_{tag}", 
-                            help=f"Filter by {tag}", use_container_width=True):
-                    st.session_state.active_filter_feed = tag
-                    st.rerun()
+        # A single widget per post instead of a column and a button per tag
+        st.pills("Tags", tags, key=key_prefix, format_func=lambda tag: f"#{tag}",
+                 label_visibility="collapsed", on_change=_apply_tag_filter, args=(key_prefix,))
+
+def _apply_tag_filter(widget_key: str):
+    """Filter the feed by the tag picked in a post's tag pills"""
+    from config import RECORDS_PAGE_SIZE
+    tag = st.session_state.get(widget_key)
+    if tag:
+        st.session_state.active_filter_feed = tag
+        st.session_state.records_shown = RECORDS_PAGE_SIZE
+    # Clear the pick so the pill doesn't stay selected after the filter is cleared
+    st.session_state[widget_key] = None
 
-def render_concert_post(concert):
+def render_concert_post(concert, now: Optional[datetime] = None):
     """Display a concert post with edit functionality"""
     # Check if current user can edit this concert
     can_edit = (st.session_state.current_user == "Admin" or 
@@ -279,13 +297,12 @@ def render_concert_post(concert):
     else:
         emoji = "🟢"
     
-    st.markdown(f'**{concert.bands}**', unsafe_allow_html=True)
-    st.markdown(f'{emoji} {date_display} • {concert.venue} • {concert.city}', unsafe_allow_html=True)
+    st.markdown(f'**{concert.bands}**\n\n{emoji} {date_display} • {concert.venue} • {concert.city}', unsafe_allow_html=True)
     
     if concert.info:
         st.caption(f"ℹ️ {concert.info}")
     
-    st.caption(f'{get_time_ago(concert.timestamp)} • @{concert.username}')
+    st.caption(f'{get_time_ago(concert.timestamp, now)} • @{concert.username}')
     
     # Action buttons
     col_actions = st.columns([1, 1])[0]
@@ -321,7 +338,6 @@ def render_concert_post(concert):
 
 def render_concert_edit_form(concert):
     """Render concert edit form"""
-    from datetime import datetime
     from utils.helpers import process_tags
     from database.operations import update_concert
     
@@ -330,7 +346,7 @@ def render_concert_edit_form(concert):
         with st.form(f"edit_concert_form_{concert.id}"):
             new_bands = st.text_input("Bands", value=concert.bands, 
                                      key=f"edit_bands_{concert.id}")
-            new_date = st.date_input("Date", value=datetime.strptime(concert.date, '%Y-%m-%d').date(), 
+            new_date = st.date_input("Date", value=concert.date_parsed, 
                                     key=f"edit_date_{concert.id}")
             new_venue = st.text_input("Venue", value=concert.venue, 
                                      key=f"edit_venue_{concert.id}")
@@ -363,21 +379,3 @@ def render_concert_edit_form(concert):
                     st.rerun()
         
         st.divider()
-
-def get_time_ago(timestamp):
-    """Calculate relative time"""
-    from datetime import datetime
-    now = datetime.now()
-    diff = now - timestamp
-    minutes = int(diff.total_seconds() / 60)
-    hours = int(diff.total_seconds() / 3600)
-    days = int(diff.total_seconds() / 86400)
-    
-    if minutes < 1:
-        return "just now"
-    elif minutes < 60:
-        return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-    elif hours < 24:
-        return f"{hours} hour{'s' if hours > 1 else ''} ago"
-    else:
-        return f"{days} day{'s' if days > 1 else ''} ago"
\ No newline at end of file
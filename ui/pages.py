@@ -4,15 +4,30 @@
 # ===========================
 
 import streamlit as st
-import webbrowser
-from typing import List
-from config import ADMIN_NAV_OPTIONS, USER_NAV_OPTIONS, SORT_OPTIONS
+from datetime import datetime
+from config import RECORDS_PAGE_SIZE
 from ui.components import render_header, render_sidebar, render_album_post, render_concert_post
 from database.operations import load_albums, load_concerts, delete_past_concerts, save_album, save_concert, check_duplicate_url
 from services.metadata_extractor import extract_og_metadata
-from services.random_album import discover_random_album
-from utils.helpers import process_tags, show_success_message
-from admin.backup_tools import admin_backup_page
+from utils.helpers import process_tags, set_success_message, show_success_message
+
+# Notice shown above the records wall to visitors who aren't logged in
+GUEST_NOTICE_HTML = """
+<div class='guest-notice'>
+👀 You're browsing as a guest. You can view all content but need to 
+<strong><a href="#" onclick="window.location.href='?show_login=true'">login</a></strong> 
+to like, post, or delete content.
+</div>
+"""
+
+# Placeholder for a discovered album without cover art
+DISCOVERY_NO_COVER_HTML = """
+<div style="width:100%; height:200px; background:#333; 
+border-radius:8px; display:flex; align-items:center; 
+justify-content:center; color:#666;">
+🎵 No cover
+</div>
+"""
 
 def main_page():
     """Main app function that handles page routing"""
@@ -33,6 +48,7 @@ def main_page():
         profile_page()
     elif page == "🔧 Admin Tools":
         if st.session_state.current_user == "Admin":
+            from admin.backup_tools import admin_backup_page
             admin_backup_page()
         else:
             st.error("⛔ Access Denied")
@@ -47,17 +63,27 @@ def records_page():
     
     # Show guest notice if not logged in
     if not st.session_state.current_user:
-        st.markdown("""
-        <div class='guest-notice'>
-        👀 You're browsing as a guest. You can view all content but need to 
-        <strong><a href="#" onclick="window.location.href='?show_login=true'">login</a></strong> 
-        to like, post, or delete content.
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(GUEST_NOTICE_HTML, unsafe_allow_html=True)
     
+    render_records_wall()
+
+@st.fragment
+def render_records_wall():
+    """
+    Top bar, album form and albums list of the records page
+    Runs as a fragment, so sorting and filtering rerun only this part of the page
+    """
     # Top bar with sorting and new post button
     render_records_top_bar()
     
+    # Automatic posts are saved here rather than in the form callback,
+    # so the slow metadata fetch can show a spinner
+    if st.session_state.pending_album_submission:
+        url, tags_input = st.session_state.pending_album_submission
+        st.session_state.pending_album_submission = None
+        with st.spinner("⏳ Extracting metadata..."):
+            handle_album_submission(url, tags_input)
+    
     # Show album form if toggled
     if st.session_state.show_album_form and st.session_state.current_user:
         render_album_form()
@@ -65,8 +91,27 @@ def records_page():
     # Load and display albums
     render_albums_list()
 
+def _set_sort_option(option: str):
+    """Sort button callback"""
+    st.session_state.sort_option = option
+    st.session_state.records_shown = RECORDS_PAGE_SIZE
+
+def _clear_feed_filter():
+    """Clear filter button callback"""
+    st.session_state.active_filter_feed = None
+    st.session_state.records_shown = RECORDS_PAGE_SIZE
+
+def _load_more_records():
+    """Load more button callback"""
+    st.session_state.records_shown += RECORDS_PAGE_SIZE
+
+def _toggle_album_form():
+    """New Post button callback"""
+    st.session_state.show_album_form = not st.session_state.show_album_form
+
 def render_records_top_bar():
     """Render top bar for records page with sorting and new post button"""
+    sort_option = st.session_state.sort_option
     col_top1, col_top2, col_top3 = st.columns([3, 2, 1])
     
     with col_top1:
@@ -75,27 +120,25 @@ def render_records_top_bar():
     with col_top2:
         # Sorting buttons
         sort_col1, sort_col2 = st.columns(2)
+        # Callbacks update the sort before the fragment reruns, so no st.rerun() is needed
         with sort_col1:
-            if st.button("📅 Timeline", 
-                       key="sort_timeline",
-                       use_container_width=True,
-                       type="primary" if st.session_state.sort_option == "Timeline" else "secondary"):
-                st.session_state.sort_option = "Timeline"
-                st.rerun()
+            st.button("📅 Timeline", 
+                      key="sort_timeline",
+                      use_container_width=True,
+                      type="primary" if sort_option == "Timeline" else "secondary",
+                      on_click=_set_sort_option, args=("Timeline",))
         with sort_col2:
-            if st.button("👍 Votes", 
-                       key="sort_votes",
-                       use_container_width=True,
-                       type="primary" if st.session_state.sort_option == "Votes" else "secondary"):
-                st.session_state.sort_option = "Votes"
-                st.rerun()
+            st.button("👍 Votes", 
+                      key="sort_votes",
+                      use_container_width=True,
+                      type="primary" if sort_option == "Votes" else "secondary",
+                      on_click=_set_sort_option, args=("Votes",))
     
     with col_top3:
         # New Post button
         if st.session_state.current_user:
-            if st.button("➕ New Post", key="new_post_button", use_container_width=True):
-                st.session_state.show_album_form = not st.session_state.show_album_form
-                st.rerun()
+            st.button("➕ New Post", key="new_post_button", use_container_width=True,
+                      on_click=_toggle_album_form)
         else:
             st.button("➕ New Post", disabled=True, use_container_width=True,
                      help="Login to post albums")
@@ -106,10 +149,15 @@ def render_album_form():
     st.subheader("🎵 New Album Post")
     
     # Show success message if form was just submitted
-    if st.session_state.get('form_submitted'):
+    if st.session_state.form_submitted:
         st.success(st.session_state.success_message)
         st.session_state.form_submitted = False
     
+    # Errors from the last submit, set by the form callbacks
+    if st.session_state.album_form_error:
+        st.error(st.session_state.album_form_error)
+        st.session_state.album_form_error = None
+    
     # Create two columns for the two input methods
     col1, col2 = st.columns(2)
     
@@ -118,41 +166,53 @@ def render_album_form():
         st.write("Paste a Spotify, Deezer or Tidal URL")
         
         with st.form("album_form_auto", clear_on_submit=True):
-            url = st.text_input("Album URL", placeholder="https://open.spotify.com/album/...")
-            tags_input = st.text_input("Tags", placeholder="Example: #deathmetal #blackmetal #thrashmetal", 
-                                     help="Maximum 5 tags")
-            submitted_auto = st.form_submit_button("Post", use_container_width=True)
-            
-            if submitted_auto:
-                handle_album_submission(url, tags_input)
+            st.text_input("Album URL", key="album_url", placeholder="https://open.spotify.com/album/...")
+            st.text_input("Tags", key="album_tags", placeholder="Example: #deathmetal #blackmetal #thrashmetal", 
+                          help="Maximum 5 tags")
+            # Submit runs as a callback, before the rerun, so a post needs no extra st.rerun()
+            st.form_submit_button("Post", use_container_width=True,
+                                  on_click=_submit_album_form, args=(False,))
     
     with col2:
         st.write("### Manual Input")
         st.write("For platforms without automatic metadata")
         
         with st.form("album_form_manual", clear_on_submit=True):
-            artist = st.text_input("Artist", placeholder="Artist name")
-            album_name = st.text_input("Album Name", placeholder="Album title")
-            url = st.text_input("Album URL", placeholder="https://...")
-            cover_url = st.text_input("Cover URL (optional)", placeholder="https://...")
-            tags_input = st.text_input("Tags", placeholder="Example: #deathmetal #blackmetal #thrashmetal", 
-                                     help="Maximum 5 tags")
-            submitted_manual = st.form_submit_button("Post", use_container_width=True)
-            
-            if submitted_manual:
-                handle_album_submission(url, tags_input, True, artist, album_name, cover_url)
+            st.text_input("Artist", key="manual_artist", placeholder="Artist name")
+            st.text_input("Album Name", key="manual_album_name", placeholder="Album title")
+            st.text_input("Album URL", key="manual_url", placeholder="https://...")
+            st.text_input("Cover URL (optional)", key="manual_cover_url", placeholder="https://...")
+            st.text_input("Tags", key="manual_tags", placeholder="Example: #deathmetal #blackmetal #thrashmetal", 
+                          help="Maximum 5 tags")
+            st.form_submit_button("Post", use_container_width=True,
+                                  on_click=_submit_album_form, args=(True,))
     
     st.markdown("---")
 
+def _submit_album_form(is_manual: bool):
+    """
+    Album form submit callback - reads the form fields from session state
+    Automatic posts are only queued here, render_records_wall fetches their metadata
+    """
+    ss = st.session_state
+    if is_manual:
+        handle_album_submission(ss.manual_url, ss.manual_tags, True,
+                                ss.manual_artist, ss.manual_album_name, ss.manual_cover_url)
+    else:
+        ss.pending_album_submission = (ss.album_url, ss.album_tags)
+
 def handle_album_submission(url: str, tags_input: str, is_manual: bool = False, 
                            artist: str = "", album_name: str = "", cover_url: str = ""):
-    """Handle album form submission"""
+    """
+    Handle album form submission
+    May run as a form callback, so messages go through session state instead of being drawn here
+    """
     # Cover handeling
     if cover_url == "":
         cover_url = "https://upload.wikimedia.org/wikipedia/commons/3/3c/No-album-art.png"
     # Check for duplicate URL
     if check_duplicate_url(url):
-        st.error("❌ This URL has already been posted. Please share a different album.")
+        st.session_state.album_form_error = "❌ This URL has already been posted. Please share a different album."
         return False
     
     if is_manual:
@@ -167,49 +227,56 @@ def handle_album_submission(url: str, tags_input: str, is_manual: bool = False,
                 "Other",
                 tags
             ):
-                show_success_message("✅ Album shared successfully!")
-                st.session_state.show_album_form = False
-                st.rerun()
+                _album_posted("✅ Album shared successfully!")
                 return True
             else:
-                st.error("❌ Error saving")
+                st.session_state.album_form_error = "❌ Error saving"
                 return False
         else:
-            st.warning("⚠️ Artist, Album Name, and Album URL are required")
+            st.session_state.album_form_error = "⚠️ Artist, Album Name, and Album URL are required"
             return False
     else:
         if url:
-            with st.spinner("⏳ Extracting metadata..."):
-                metadata = extract_og_metadata(url)
-                if metadata:
-                    tags = process_tags(tags_input)
-                    if save_album(
-                        st.session_state.current_user,
-                        url,
-                        metadata['artist'],
-                        metadata['album_name'],
-                        metadata['cover_url'],
-                        metadata['platform'],
-                        tags
-                    ):
-                        show_success_message("✅ Album shared successfully!")
-                        st.session_state.show_album_form = False
-                        st.rerun()
-                        return True
-                    else:
-                        st.error("❌ Error saving")
-                        return False
+            metadata = extract_og_metadata(url)
+            if metadata:
+                tags = process_tags(tags_input)
+                if save_album(
+                    st.session_state.current_user,
+                    url,
+                    metadata['artist'],
+                    metadata['album_name'],
+                    metadata['cover_url'],
+                    metadata['platform'],
+                    tags
+                ):
+                    _album_posted("✅ Album shared successfully!")
+                    return True
                 else:
-                    st.error("❌ Could not extract metadata. Verify the URL or use Manual Input")
+                    st.session_state.album_form_error = "❌ Error saving"
                     return False
+            else:
+                st.session_state.album_form_error = "❌ Could not extract metadata. Verify the URL or use Manual Input"
+                return False
         else:
-            st.warning("⚠️ Please paste a valid URL")
+            st.session_state.album_form_error = "⚠️ Please paste a valid URL"
             return False
 
+def _album_posted(message: str):
+    """Close the album form and keep the success message for the next render"""
+    set_success_message(message)
+    st.session_state.show_album_form = False
+
 def render_albums_list():
     """Load and display albums with sorting and filtering"""
     albums = load_albums()
     
+    # Empty wall - nothing to sort, filter or render
+    if not albums:
+        st.info("📭 No albums to display")
+        return
+    
+    active_filter = st.session_state.active_filter_feed
+    
     # Apply sorting
     if st.session_state.sort_option == "Votes":
         albums = sorted(albums, key=lambda x: len(x.likes), reverse=True)
@@ -219,26 +286,33 @@ def render_albums_list():
         show_rank = False
     
     # Apply tag filter if active
-    if st.session_state.active_filter_feed:
+    if active_filter:
         col_filter1, col_filter2 = st.columns([3, 1])
         with col_filter1:
-            st.info(f"🔍 Filtered by: **#{st.session_state.active_filter_feed}**")
+            st.info(f"🔍 Filtered by: **#{active_filter}**")
         with col_filter2:
-            if st.button("✖️ Clear filter", key="clear_feed_filter", use_container_width=True):
-                st.session_state.active_filter_feed = None
-                st.rerun()
+            st.button("✖️ Clear filter", key="clear_feed_filter", use_container_width=True,
+                      on_click=_clear_feed_filter)
     
-    if st.session_state.active_filter_feed:
-        albums = [a for a in albums if st.session_state.active_filter_feed.lower() in [t.lower() for t in a.tags]]
+    if active_filter:
+        active_tag = active_filter.lower()
+        albums = [a for a in albums if active_tag in a.tags_lower]
     
     if not albums:
         st.info("📭 No albums to display")
     else:
-        for idx, album in enumerate(albums, 1):
+        # Only render the first records_shown posts; the rest load on demand
+        shown = st.session_state.records_shown
+        now = datetime.now()
+        for idx, album in enumerate(albums[:shown], 1):
             if show_rank:
-                render_album_post(album, show_rank=True, rank=idx)
+                render_album_post(album, show_rank=True, rank=idx, now=now)
             else:
-                render_album_post(album)
+                render_album_post(album, now=now)
+        
+        if len(albums) > shown:
+            st.button(f"⬇️ Load more ({len(albums) - shown} left)", key="load_more_records",
+                      use_container_width=True, on_click=_load_more_records)
 
 # ============ GIGS PAGE ============
 
@@ -247,14 +321,25 @@ def gigs_page():
     st.subheader("🎸 Gigs")
     delete_past_concerts()
     
+    render_gigs_board()
+
+def _toggle_concert_form():
+    """New Concert button callback"""
+    st.session_state.show_concert_form = not st.session_state.show_concert_form
+
+@st.fragment
+def render_gigs_board():
+    """
+    New concert button, concert form and concerts list of the gigs page
+    Runs as a fragment, so toggling the form reruns only this part of the page
+    """
     col1, col2 = st.columns([3, 1])
     with col1:
         st.write("Upcoming metal events")
     with col2:
         # Only show New Concert button if user is logged in
         if st.session_state.current_user:
-            if st.button("➕ New Concert", use_container_width=True):
-                st.session_state.show_concert_form = not st.session_state.show_concert_form
+            st.button("➕ New Concert", use_container_width=True, on_click=_toggle_concert_form)
         else:
             st.button("➕ New Concert", disabled=True, use_container_width=True,
                      help="Login to add concerts")
@@ -295,8 +380,9 @@ def render_concerts_list():
     if not concerts:
         st.info("📭 No upcoming concerts")
     else:
+        now = datetime.now()
         for concert in concerts:
-            render_concert_post(concert)
+            render_concert_post(concert, now=now)
 
 # ============ RANDOM ALBUM PAGE ============
 
@@ -311,6 +397,44 @@ def random_album_page():
     
     st.divider()
     
+    render_discovery()
+
+def _discover_another(origin: dict):
+    """Discover Another button callback - reuses the same base artist"""
+    from services.random_album import discover_random_album, record_discovery, take_prefetched_discovery
+    # Use the discovery prepared in the background for this base album if there is one
+    pending = st.session_state.next_discovery
+    st.session_state.next_discovery = None
+    # From now on, each discovery from this base artist prepares the next one
+    st.session_state.discover_another_artist = origin['artist']
+    prefetched = None
+    if pending and pending[0] == origin['artist']:
+        prefetched = take_prefetched_discovery(pending[1])
+    
+    if prefetched:
+        new_discovery, error = prefetched
+        if new_discovery:
+            record_discovery(new_discovery)
+    else:
+        new_discovery, error = discover_random_album(
+            base_artist=origin['artist'],
+            base_album_obj=origin['album']
+        )
+    if error:
+        # Shown by the fragment - callbacks can't draw elements during a fragment rerun
+        st.session_state.discovery_error = error
+    else:
+        st.session_state.random_discovery_data = new_discovery
+
+@st.fragment
+def render_discovery():
+    """
+    Discover button and the current discovery card
+    Runs as a fragment, so discovering reruns only this part of the page
+    """
+    # Discovery pulls in rapidfuzz and the API services; only load them on this page
+    from services.random_album import discover_random_album, prefetch_next_discovery
+    
     # Discover Button
     col_btn1, col_btn2 = st.columns([3, 1])
     
@@ -325,13 +449,30 @@ def random_album_page():
                 if error:
                     st.error(f"❌ {error}")
                 elif discovery_data:
+                    # The card below reads this in the same run, no rerun needed
                     st.session_state.random_discovery_data = discovery_data
-                    st.rerun()
+    
+    # Error from the last "Discover Another" click
+    if st.session_state.discovery_error:
+        st.error(f"❌ {st.session_state.discovery_error}")
+        st.session_state.discovery_error = None
     
     # Display discovery if available
     if st.session_state.random_discovery_data:
         discovery_data = st.session_state.random_discovery_data
         
+        # Once "Discover Another" has been used for this base artist, get the
+        # next one ready in the background while this discovery is on screen
+        origin = discovery_data['origin']
+        pending = st.session_state.next_discovery
+        if (st.session_state.discover_another_artist == origin['artist']
+                and (not pending or pending[0] != origin['artist'])):
+            future = prefetch_next_discovery(origin['artist'], origin['album'])
+            st.session_state.next_discovery = (origin['artist'], future) if future else None
+        
+        if discovery_data.get('warning'):
+            st.warning(discovery_data['warning'])
+        
         # Discovery path
         st.markdown("<div class='discovery-path'>", unsafe_allow_html=True)
         st.markdown(f"**{discovery_data['description']}**")
@@ -347,13 +488,7 @@ def random_album_page():
             if discovery.get('image'):
                 st.image(discovery['image'])
             else:
-                st.markdown("""
-                <div style="width:100%; height:200px; background:#333; 
-                border-radius:8px; display:flex; align-items:center; 
-                justify-content:center; color:#666;">
-                🎵 No cover
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(DISCOVERY_NO_COVER_HTML, unsafe_allow_html=True)
         
         with col_info:
             st.markdown(f"## {discovery['album']}")
@@ -369,43 +504,23 @@ def random_album_page():
             if discovery.get('genres'):
                 st.write(f"**Genres:** {', '.join(discovery['genres'][:3])}")
             
-            # Action buttons
+            # Action buttons - link buttons first, then Discover Another and Post to Wall
+            links = [("🎵 Open in Spotify", discovery['url'])]
             if discovery_data.get('bandcamp'):
-                col_actions = st.columns([1, 1, 1, 1])
-            else:
-                col_actions = st.columns([1, 1, 1])
-            
-            col_idx = 0
+                links.append(("🎶 Open in Bandcamp", discovery_data['bandcamp']['url']))
             
-            with col_actions[col_idx]:
-                with col_actions[col_idx]:
-                    st.link_button("🎵 Open in Spotify", discovery['url'], use_container_width=True)
-            col_idx += 1
+            *link_cols, col_another, col_post = st.columns(len(links) + 2)
+            for col, (label, url) in zip(link_cols, links):
+                col.link_button(label, url, use_container_width=True)
             
-            # Add Bandcamp button if available
-            if discovery_data.get('bandcamp'):
-                with col_actions[col_idx]:
-                    st.link_button("🎶 Open in Bandcamp", discovery_data['bandcamp']['url'], use_container_width=True)
-                col_idx += 1
-            
-            with col_actions[col_idx]:
-                if st.button("🔁 Discover Another", 
-                           use_container_width=True,
-                           key="discover_another"):
-                    # Reuse the same base artist for new discovery
-                    origin = discovery_data['origin']
-                    new_discovery, error = discover_random_album(
-                        base_artist=origin['artist'],
-                        base_album_obj=origin['album']
-                    )
-                    if error:
-                        st.error(f"❌ {error}")
-                    else:
-                        st.session_state.random_discovery_data = new_discovery
-                    st.rerun()
-            col_idx += 1
+            with col_another:
+                # Discovers in the click callback, so the card is drawn with the new album
+                st.button("🔁 Discover Another", 
+                          use_container_width=True,
+                          key="discover_another",
+                          on_click=_discover_another, args=(discovery_data['origin'],))
             
-            with col_actions[col_idx]:
+            with col_post:
                 if st.button("📤 Post to Wall", 
                            use_container_width=True,
                            key="post_to_wall"):
@@ -415,12 +530,15 @@ def random_album_page():
                         tags_input = "#randomdiscovery"
                         
                         # Call the handle_album_submission function
-                        success = handle_album_submission(url, tags_input, is_manual=False)
+                        with st.spinner("⏳ Extracting metadata..."):
+                            success = handle_album_submission(url, tags_input, is_manual=False)
                         if success:
                             st.success("✅ Album posted to wall!")
                             show_success_message("✅ Album posted successfully!")
                         else:
-                            st.error("❌ Failed to post to wall")
+                            # handle_album_submission leaves the reason for the album form to show
+                            st.error(st.session_state.album_form_error or "❌ Failed to post to wall")
+                            st.session_state.album_form_error = None
                     else:
                         st.warning("Please login to post to wall")
         
@@ -466,11 +584,16 @@ def profile_page():
     else:
         albums = load_albums()
         concerts = load_concerts()
-        my_albums = [a for a in albums if a.username == st.session_state.current_user]
-        my_concerts = [c for c in concerts if c.username == st.session_state.current_user]
+        user = st.session_state.current_user
         
-        # Get liked albums
-        liked_albums = [a for a in albums if st.session_state.current_user in a.likes]
+        # Split own and liked albums in a single pass
+        my_albums, liked_albums = [], []
+        for album in albums:
+            if album.username == user:
+                my_albums.append(album)
+            if user in album.likes:
+                liked_albums.append(album)
+        my_concerts = [c for c in concerts if c.username == user]
         
         # Show counts
         col1, col2, col3 = st.columns(3)
@@ -482,21 +605,36 @@ def profile_page():
             st.metric("❤️ Liked Albums", len(liked_albums))
         
         st.divider()
+        now = datetime.now()
         
         if my_albums:
-            st.write("### 🎵 My Albums")
-            for album in my_albums:
-                render_album_post(album)
+            render_profile_section("🎵 My Albums", "my_albums", my_albums,
+                                   lambda album: render_album_post(album, now=now))
         
         if liked_albums:
-            st.write("### ❤️ Liked Albums")
-            for album in liked_albums:
-                render_album_post(album)
+            render_profile_section("❤️ Liked Albums", "liked_albums", liked_albums,
+                                   lambda album: render_album_post(album, now=now))
         
         if my_concerts:
-            st.write("### 🎸 My Gigs")
-            for concert in my_concerts:
-                render_concert_post(concert)
+            render_profile_section("🎸 My Gigs", "my_concerts", my_concerts,
+                                   lambda concert: render_concert_post(concert, now=now))
         
         if not my_albums and not my_concerts and not liked_albums:
-            st.info("📭 You haven't shared or liked anything yet")
\ No newline at end of file
+            st.info("📭 You haven't shared or liked anything yet")
+
+def _show_more_profile_items(shown_key: str):
+    """Show more button callback for a profile section"""
+    st.session_state[shown_key] = st.session_state.get(shown_key, RECORDS_PAGE_SIZE) + RECORDS_PAGE_SIZE
+
+def render_profile_section(title: str, key: str, items: list, render_item):
+    """Render a collapsed profile section, one page of items at a time"""
+    shown_key = f"profile_{key}_shown"
+    shown = st.session_state.get(shown_key, RECORDS_PAGE_SIZE)
+    
+    with st.expander(f"{title} ({len(items)})", expanded=False):
+        for item in items[:shown]:
+            render_item(item)
+        
+        if len(items) > shown:
+            st.button(f"⬇️ Show more ({len(items) - shown} left)", key=f"show_more_{key}",
+                      use_container_width=True, on_click=_show_more_profile_items, args=(shown_key,))
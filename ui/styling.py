@@ -3,9 +3,8 @@
 # UI STYLING AND CSS
 # ===========================
 
-def get_custom_css() -> str:
-    """Return custom CSS for the app"""
-    return """
+# Custom CSS for the app, emitted at the top of every full rerun
+CUSTOM_CSS = """
     <style>
         body {
             background-color: #0a0e27;
@@ -87,4 +86,4 @@ def get_custom_css() -> str:
             color: #666;
         }
     </style>
-    """
\ No newline at end of file
+"""
@@ -5,35 +5,40 @@
 
 import streamlit as st
 import re
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
+
+# A tag is letters, digits and underscores, with at least one letter or digit
+TAG_RE = re.compile(r'\A_*[^\W_]\w*\Z')
 
 def verify_credentials(username: str, password: str) -> tuple[bool, str]:
     """Verify user credentials"""
     try:
-        if username in st.secrets:
-            if st.secrets[username]["password"] == password:
-                return True, st.secrets[username].get("email", username)
+        user = st.secrets.get(username)
+        if user and user["password"] == password:
+            return True, user.get("email", username)
         return False, ""
     except Exception as e:
         print(f"Authentication error: {e}")
         return False, ""
 
-def get_time_ago(timestamp: datetime) -> str:
-    """Calculate relative time"""
-    now = datetime.now()
-    diff = now - timestamp
-    minutes = int(diff.total_seconds() / 60)
-    hours = int(diff.total_seconds() / 3600)
-    days = int(diff.total_seconds() / 86400)
+def get_time_ago(timestamp: datetime, now: Optional[datetime] = None) -> str:
+    """
+    Calculate relative time
+    Pass now when rendering a list so every post is measured against one clock read
+    """
+    seconds = ((now or datetime.now()) - timestamp).total_seconds()
     
-    if minutes < 1:
+    if seconds < 60:
         return "just now"
-    elif minutes < 60:
+    elif seconds < 3600:
+        minutes = int(seconds / 60)
         return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-    elif hours < 24:
+    elif seconds < 86400:
+        hours = int(seconds / 3600)
         return f"{hours} hour{'s' if hours > 1 else ''} ago"
     else:
+        days = int(seconds / 86400)
         return f"{days} day{'s' if days > 1 else ''} ago"
 
 def format_date_display(date_str: str) -> str:
@@ -47,10 +52,7 @@ def format_date_display(date_str: str) -> str:
 def get_days_until(date_str: str) -> int:
     """Calculate days until concert"""
     try:
-        concert_date = datetime.strptime(date_str, '%Y-%m-%d')
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        concert_date = concert_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        return (concert_date - today).days
+        return (date.fromisoformat(date_str) - date.today()).days
     except:
         return 0
 
@@ -62,12 +64,16 @@ def process_tags(tags_str: str) -> List[str]:
         if tag:
             if tag.startswith('#'):
                 tag = tag[1:]
-            if tag.replace('_', '').isalnum():
+            if TAG_RE.match(tag):
                 tags.append(tag)
     return tags[:5]
 
-def show_success_message(message: str):
-    """Show a success message and update session state"""
+def set_success_message(message: str):
+    """Keep a success message in session state for the next render"""
     st.session_state.success_message = message
     st.session_state.form_submitted = True
+
+def show_success_message(message: str):
+    """Show a success message and update session state"""
+    set_success_message(message)
     st.success(message)
\ No newline at end of file
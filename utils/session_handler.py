@@ -6,7 +6,29 @@
 import streamlit as st
 import json
 import base64
-from datetime import datetime
+import hashlib
+import hmac
+import secrets
+import time
+
+# How long a remembered login stays valid
+SESSION_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+# Bytes of the HMAC-SHA256 tag kept at the front of each session token
+SESSION_SIGNATURE_SIZE = 16
+
+@st.cache_resource
+def _session_key() -> bytes:
+    """Key for signing session tokens - SESSION_SECRET from secrets, else random per process"""
+    try:
+        secret = st.secrets.get("SESSION_SECRET", "")
+    except Exception:
+        secret = ""
+    # Without a configured secret, remembered logins last until the app restarts
+    return secret.encode() if secret else secrets.token_bytes(32)
+
+def _sign(payload: bytes) -> bytes:
+    """Signature of a session payload"""
+    return hmac.new(_session_key(), payload, hashlib.sha256).digest()[:SESSION_SIGNATURE_SIZE]
 
 def save_session_to_storage():
     """Save current session state to browser's localStorage using query params"""
@@ -14,35 +36,42 @@ def save_session_to_storage():
         session_data = {
             'username': st.session_state.current_user,
             'remember_me': True,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         }
-        # Encode the session data and set it as a query parameter
-        encoded_data = base64.urlsafe_b64encode(json.dumps(session_data).encode()).decode()
+        # Sign and encode the session data and set it as a query parameter
+        payload = json.dumps(session_data).encode()
+        encoded_data = base64.urlsafe_b64encode(_sign(payload) + payload).decode()
         st.query_params['session'] = encoded_data
 
 def load_session_from_storage() -> bool:
     """Load session from query parameters"""
+    encoded_data = st.query_params.get('session')
+    # A token turned down before stays in the URL for every guest rerun; don't decode it again
+    if not encoded_data or encoded_data == st.session_state.get('rejected_session_token'):
+        return False
+    
     try:
-        if 'session' in st.query_params:
-            encoded_data = st.query_params['session']
-            session_data = json.loads(base64.urlsafe_b64decode(encoded_data).decode())
+        token = base64.urlsafe_b64decode(encoded_data)
+        signature, payload = token[:SESSION_SIGNATURE_SIZE], token[SESSION_SIGNATURE_SIZE:]
+        
+        # Forged or altered tokens are turned down before any parsing
+        if hmac.compare_digest(signature, _sign(payload)):
+            session_data = json.loads(payload)
             
             # Check if session is not too old (7 days max)
-            session_time = datetime.fromisoformat(session_data['timestamp'])
-            if (datetime.now() - session_time).days < 7:
+            if time.time() - session_data['timestamp'] < SESSION_MAX_AGE:
                 st.session_state.current_user = session_data['username']
                 st.session_state.remember_me = session_data['remember_me']
                 return True
-    except:
+    except (ValueError, KeyError, TypeError):
+        # Bad base64, UTF-8 or JSON (all ValueError), or a payload without the expected fields
         pass
+    
+    # Expired, malformed or not signed by this app
+    st.session_state.rejected_session_token = encoded_data
     return False
 
 def clear_session_storage():
     """Clear the session from query params"""
     # Clear only the session parameter
-    params = dict(st.query_params)
-    if 'session' in params:
-        del params['session']
-        st.query_params.clear()
-        for key, value in params.items():
-            st.query_params[key] = value
\ No newline at end of file
+    st.query_params.pop('session', None)
\ No newline at end of file